@@ -1,19 +1,28 @@
+import sys
 import warnings
+from collections import deque
 from enum import StrEnum
 from functools import cached_property
 from typing import (
     Annotated,
     Any,
     Generic,
+    Iterable,
     Mapping,
     Protocol,
     Self,
     Sequence,
     TypeVar,
-    runtime_checkable,
 )
 
-from pydantic import AfterValidator, BaseModel, Field, model_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    Field,
+    GetPydanticSchema,
+    model_validator,
+)
+from pydantic_core import core_schema
 
 # TypeVar for dict-like types, particularly TypedDict subclasses
 # Using Mapping as the bound since TypedDict is compatible with Mapping
@@ -22,6 +31,14 @@ PulledVariablesT = TypeVar("PulledVariablesT", bound=Mapping[str, Any])
 MetadataT = TypeVar("MetadataT", bound=Mapping[str, Any])
 GlobalVariablesT = TypeVar("GlobalVariablesT", bound=Mapping[str, Any])
 
+# Method keys take only a handful of distinct values and are used to look up pull and
+# aggregation methods, so intern them to make those dict lookups pointer comparisons
+MethodKey = Annotated[str, AfterValidator(sys.intern)]
+
+# The method Protocols below are for static typing only; at runtime pydantic just checks
+# that the values are callable, which avoids a structural isinstance check per method
+AsCallable = GetPydanticSchema(lambda _source, _handler: core_schema.callable_schema())
+
 
 class Direction(StrEnum):
     """Enum representing the direction of data flow in a graph edge."""
@@ -30,7 +47,6 @@ class Direction(StrEnum):
     from_downstream = "FROM_DOWNSTREAM"
 
 
-@runtime_checkable
 class PullMethod(
     Protocol, Generic[BaseVariablesT, PulledVariablesT, MetadataT, GlobalVariablesT]
 ):
@@ -48,7 +64,6 @@ class PullMethod(
     ) -> PulledVariablesT: ...
 
 
-@runtime_checkable
 class AggregationMethod(Protocol, Generic[BaseVariablesT, PulledVariablesT, MetadataT]):
     """Protocol for methods that aggregate pulled variables into a node.
 
@@ -73,27 +88,45 @@ class HasIdAndName(Protocol):
     def name(self) -> str: ...
 
 
-def _validate_id_and_name_unique(value: list[HasIdAndName]) -> list[HasIdAndName]:
+def _validate_id_and_name_unique(
+    value: Sequence[HasIdAndName],
+) -> Sequence[HasIdAndName]:
     """Validate that all items in the list have unique IDs and names.
 
     Args:
-        value: List of items that have id and name properties.
+        value: Sequence of items that have id and name properties.
 
     Returns:
-        The input list if validation passes.
+        The input sequence if validation passes.
 
     Raises:
         ValueError: If duplicate IDs or names are found.
     """
-    id_v_dict: dict[int, list[tuple[int, str]]] = {_.id: [] for _ in value}
+    seen_ids: set[int] = set()
+    seen_names: set[str] = set()
+    duped_ids: set[int] = set()
+    duped_names: set[str] = set()
     for v in value:
-        id_v_dict[v.id].append((v.id, v.name))
-    dups_ids = {k: v for k, v in id_v_dict.items() if len(v) > 1}
+        if v.id in seen_ids:
+            duped_ids.add(v.id)
+        else:
+            seen_ids.add(v.id)
+        if v.name in seen_names:
+            duped_names.add(v.name)
+        else:
+            seen_names.add(v.name)
 
-    name_v_dict: dict[str, list[tuple[int, str]]] = {_.name: [] for _ in value}
+    if not duped_ids and not duped_names:
+        return value
+
+    # only collect the offending (id, name) pairs once a duplicate is known to exist
+    dups_ids: dict[int, list[tuple[int, str]]] = {}
+    dups_names: dict[str, list[tuple[int, str]]] = {}
     for v in value:
-        name_v_dict[v.name].append((v.id, v.name))
-    dups_names = {k: v for k, v in name_v_dict.items() if len(v) > 1}
+        if v.id in duped_ids:
+            dups_ids.setdefault(v.id, []).append((v.id, v.name))
+        if v.name in duped_names:
+            dups_names.setdefault(v.name, []).append((v.id, v.name))
 
     if dups_ids and not dups_names:
         raise ValueError(f"Duplicated ids: {dups_ids}")
@@ -109,24 +142,24 @@ def _validate_id_and_name_unique(value: list[HasIdAndName]) -> list[HasIdAndName
     return value
 
 
-def _validate_no_duped_edges(edges: list["Edge"]) -> list["Edge"]:
-    """Validate that no duplicate edges exist and the graph is acyclic.
+def _validate_no_duped_edges(edges: Sequence["Edge"]) -> Sequence["Edge"]:
+    """Validate that no duplicate or bidirectional edges exist.
 
     Checks for:
     - Duplicate edges in the same direction (same upstream and downstream node pair)
     - Bidirectional edges that would create cycles
 
     Args:
-        edges: List of edges to validate.
+        edges: Sequence of edges to validate.
 
     Returns:
-        The input list if validation passes.
+        The input sequence if validation passes.
 
     Raises:
         ValueError: If duplicate or bidirectional edges are found.
     """
-    # Track edges by (upstream_node_id, downstream_node_id) tuple
-    seen_edges: dict[tuple[int, int], list[tuple[int, str]]] = {}
+    # Track seen (upstream_node_id, downstream_node_id) pairs
+    seen_edges: set[tuple[int, int]] = set()
     duplicate_same_direction = []
     bidirectional_edges = []
 
@@ -138,9 +171,7 @@ def _validate_no_duped_edges(edges: list["Edge"]) -> list["Edge"]:
         if edge_tuple in seen_edges:
             duplicate_same_direction.append((edge.id, edge.name))
         else:
-            seen_edges[edge_tuple] = []
-
-        seen_edges[edge_tuple].append((edge.id, edge.name))
+            seen_edges.add(edge_tuple)
 
         # Check for bidirectional edge (reverse direction already exists)
         if reverse_tuple in seen_edges:
@@ -159,6 +190,133 @@ def _validate_no_duped_edges(edges: list["Edge"]) -> list["Edge"]:
     return edges
 
 
+def _validate_nodes(
+    nodes: Sequence["Node[Any, Any, Any]"],
+) -> tuple["Node[Any, Any, Any]", ...]:
+    """Validate the nodes of a graph and store them as a tuple.
+
+    Args:
+        nodes: Sequence of nodes to validate.
+
+    Returns:
+        The nodes as a tuple if validation passes.
+
+    Raises:
+        ValueError: If duplicate IDs or names are found.
+    """
+    _validate_id_and_name_unique(nodes)
+    return tuple(nodes)
+
+
+def _validate_edges(edges: Sequence["Edge"]) -> tuple["Edge", ...]:
+    """Validate the edges of a graph and store them as a tuple.
+
+    Args:
+        edges: Sequence of edges to validate.
+
+    Returns:
+        The edges as a tuple if validation passes.
+
+    Raises:
+        ValueError: If duplicate IDs or names, or duplicate or bidirectional edges are found.
+    """
+    _validate_id_and_name_unique(edges)
+    _validate_no_duped_edges(edges)
+    return tuple(edges)
+
+
+def _reachable_node_id_sets(
+    adj: Mapping[int, Sequence[int]],
+    order: Iterable[int],
+) -> dict[int, set[int]]:
+    """Compute the set of all node IDs transitively reachable from each node.
+
+    Nodes are processed in a single sweep over ``order``, which must list every node
+    after all of its neighbours in ``adj``, so each set is built from finished ones.
+
+    Args:
+        adj: Dictionary mapping node IDs to the IDs of their direct neighbours.
+        order: Node IDs ordered so that neighbours come before the nodes pointing at them.
+
+    Returns:
+        Dictionary mapping node IDs to the set of IDs of all nodes reachable from them.
+    """
+    reachable: dict[int, set[int]] = {}
+    for node_id in order:
+        node_ids: set[int] = set()
+        for neighbour_id in adj[node_id]:
+            node_ids |= reachable[neighbour_id]
+            node_ids.add(neighbour_id)
+        reachable[node_id] = node_ids
+
+    return reachable
+
+
+def _nodes_on_cycles(
+    node_ids: Iterable[int],
+    adj: Mapping[int, Sequence[int]],
+) -> set[int]:
+    """Return the IDs of the nodes that lie on a cycle, using Tarjan's SCC algorithm.
+
+    Only edges between the given nodes are followed. A node lies on a cycle if its
+    strongly connected component has more than one node, or if it has an edge to
+    itself. The depth first search is iterative so deep graphs cannot hit the
+    recursion limit.
+
+    Args:
+        node_ids: IDs of the nodes to search, e.g. those left over by a topological sort.
+        adj: Dictionary mapping node IDs to the IDs of their direct neighbours.
+
+    Returns:
+        Set of IDs of the given nodes that lie on a cycle.
+    """
+    candidates = set(node_ids)
+    index: dict[int, int] = {}
+    low: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+    on_cycle: set[int] = set()
+
+    for root_id in candidates:
+        if root_id in index:
+            continue
+        index[root_id] = low[root_id] = len(index)
+        stack.append(root_id)
+        on_stack.add(root_id)
+        work = [(root_id, iter(adj[root_id]))]
+        while work:
+            node_id, neighbours = work[-1]
+            for neighbour_id in neighbours:
+                if neighbour_id not in candidates:
+                    continue
+                if neighbour_id not in index:
+                    index[neighbour_id] = low[neighbour_id] = len(index)
+                    stack.append(neighbour_id)
+                    on_stack.add(neighbour_id)
+                    work.append((neighbour_id, iter(adj[neighbour_id])))
+                    break
+                if neighbour_id in on_stack:
+                    low[node_id] = min(low[node_id], index[neighbour_id])
+            else:
+                # every neighbour has been visited, so node_id is finished
+                work.pop()
+                if work:
+                    parent_id = work[-1][0]
+                    low[parent_id] = min(low[parent_id], low[node_id])
+                if low[node_id] == index[node_id]:
+                    component: list[int] = []
+                    while True:
+                        member_id = stack.pop()
+                        on_stack.discard(member_id)
+                        component.append(member_id)
+                        if member_id == node_id:
+                            break
+                    if len(component) > 1 or node_id in adj[node_id]:
+                        on_cycle.update(component)
+
+    return on_cycle
+
+
 class Node(BaseModel, Generic[BaseVariablesT, PulledVariablesT, MetadataT]):
     """Represents a node in a directed acyclic graph.
 
@@ -177,13 +335,17 @@ class Node(BaseModel, Generic[BaseVariablesT, PulledVariablesT, MetadataT]):
         pulled_from_upstream: Flag indicating if data has been pulled from upstream nodes.
     """
 
+    # each parametrization (e.g. Node[BaseVariables, ...]) is its own model class, so
+    # only build the core schema for the ones that are actually instantiated
+    model_config = {"extra": "forbid", "defer_build": True}
+
     id: int
     name: str
     base_variables: BaseVariablesT
     pulled_variables: PulledVariablesT
     metadata: MetadataT
-    pull_from_downstream_agg_key: str
-    pull_from_upstream_agg_key: str
+    pull_from_downstream_agg_key: MethodKey
+    pull_from_upstream_agg_key: MethodKey
     pulled_from_downstream: bool = False
     pulled_from_upstream: bool = False
 
@@ -203,16 +365,21 @@ class Edge(BaseModel):
         upstream_method_key: Key for the pull method to use when pulling from upstream.
     """
 
+    model_config = {"extra": "forbid", "frozen": True, "defer_build": True}
+
     id: int
     name: str
     downstream_node_id: int
     upstream_node_id: int
-    downstream_method_key: str
-    upstream_method_key: str
+    downstream_method_key: MethodKey
+    upstream_method_key: MethodKey
 
     @model_validator(mode="after")
     def _no_dup_node_ids(self) -> Self:
-        """Validate that upstream and downstream node IDs are different to prevent self-loops."""
+        """Validate that upstream and downstream node IDs are different to prevent self-loops.
+
+        Runs after field validation so the IDs are compared as coerced ints.
+        """
         if self.downstream_node_id == self.upstream_node_id:
             raise ValueError(f"edge: {self.id, self.name} has a cyclical dependency.")
         return self
@@ -227,141 +394,156 @@ class Graph(
     methods for pulling and aggregating data between connected nodes. It enforces
     several constraints:
     - Node and edge IDs and names must be unique
-    - No duplicate or bidirectional edges (maintains acyclic property)
+    - No duplicate or bidirectional edges
+    - No cycles (maintains acyclic property)
     - All referenced pull and aggregation method keys must exist
     - All edge node IDs must reference existing nodes
 
+    Graphs are immutable once constructed, so derived views such as the
+    adjacency maps and topological order are computed lazily and cached.
+    model_copy drops these cached views, so a copy made with update= recomputes
+    them from its own nodes and edges. As with any pydantic model, the updated
+    fields are not re-validated.
+
     Attributes:
-        nodes: Sequence of Node objects in the graph.
-        edges: Sequence of Edge objects connecting the nodes.
+        nodes: Sequence of Node objects in the graph, stored as a tuple.
+        edges: Sequence of Edge objects connecting the nodes, stored as a tuple.
         global_variables: Global variables accessible to all nodes and edges.
         pull_methods: Dictionary mapping method keys to pull method implementations.
         agg_methods: Dictionary mapping method keys to aggregation method implementations.
     """
 
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = {
+        "arbitrary_types_allowed": True,
+        "frozen": True,
+        "defer_build": True,
+    }
 
     nodes: Annotated[
         Sequence[Node[BaseVariablesT, PulledVariablesT, MetadataT]],
-        AfterValidator(_validate_id_and_name_unique),
+        AfterValidator(_validate_nodes),
     ]
     edges: Annotated[
         Sequence[Edge],
-        AfterValidator(_validate_id_and_name_unique),
-        AfterValidator(_validate_no_duped_edges),
+        AfterValidator(_validate_edges),
     ]
     global_variables: GlobalVariablesT
     pull_methods: dict[
-        str, PullMethod[BaseVariablesT, PulledVariablesT, MetadataT, GlobalVariablesT]
+        MethodKey,
+        Annotated[
+            PullMethod[BaseVariablesT, PulledVariablesT, MetadataT, GlobalVariablesT],
+            AsCallable,
+        ],
     ] = Field(exclude=True)
     agg_methods: dict[
-        str, AggregationMethod[BaseVariablesT, PulledVariablesT, MetadataT]
+        MethodKey,
+        Annotated[
+            AggregationMethod[BaseVariablesT, PulledVariablesT, MetadataT],
+            AsCallable,
+        ],
     ] = Field(exclude=True)
 
     @model_validator(mode="after")
-    def _validate_pull_method_keys(self) -> Self:
-        """Validate that all edge pull method keys exist in pull_methods dict."""
-        keys = self.pull_methods.keys()
-        edges_with_missing_upstream_keys: list[Edge] = []
-        for edge in self.edges:
-            if edge.upstream_method_key not in keys:
-                edges_with_missing_upstream_keys.append(edge)
+    def _validate_all(self) -> Self:
+        """Validate method keys, edge node IDs and acyclicity, and warn about orphaned nodes.
 
+        Edges and nodes are each scanned once, and every problem found is reported
+        together in a single ValueError so that all of them can be fixed at once.
+        """
+        pull_method_keys = self.pull_methods.keys()
+        agg_method_keys = self.agg_methods.keys()
+        # populates the cached nodes_as_dict rather than building a throwaway id set
+        node_ids = self.nodes_as_dict.keys()
+
+        edges_with_missing_upstream_keys: list[Edge] = []
         edges_with_missing_downstream_keys: list[Edge] = []
+        edges_with_invalid_upstream_node_ids: list[Edge] = []
+        edges_with_invalid_downstream_node_ids: list[Edge] = []
         for edge in self.edges:
-            if edge.downstream_method_key not in keys:
+            if edge.upstream_method_key not in pull_method_keys:
+                edges_with_missing_upstream_keys.append(edge)
+            if edge.downstream_method_key not in pull_method_keys:
                 edges_with_missing_downstream_keys.append(edge)
+            if edge.upstream_node_id not in node_ids:
+                edges_with_invalid_upstream_node_ids.append(edge)
+            if edge.downstream_node_id not in node_ids:
+                edges_with_invalid_downstream_node_ids.append(edge)
 
-        if edges_with_missing_upstream_keys or edges_with_missing_downstream_keys:
-            raise ValueError(
-                "The following edges have missing upstream keys: "
-                f"{[(edge.id, edge.name, edge.upstream_method_key) for edge in edges_with_missing_upstream_keys]}.\n"
-                "The following edges have missing downstream keys: "
-                f"{[(edge.id, edge.name, edge.downstream_method_key) for edge in edges_with_missing_downstream_keys]}.\n"
-            )
-
-        return self
-
-    @model_validator(mode="after")
-    def _validate_agg_method_keys(self) -> Self:
-        """Validate that all node aggregation method keys exist in agg_methods dict."""
-        keys = self.agg_methods.keys()
         nodes_with_missing_downstream_keys: list[
             Node[BaseVariablesT, PulledVariablesT, MetadataT]
         ] = []
-        for node in self.nodes:
-            if node.pull_from_downstream_agg_key not in keys:
-                nodes_with_missing_downstream_keys.append(node)
-
         nodes_with_missing_upstream_keys: list[
             Node[BaseVariablesT, PulledVariablesT, MetadataT]
         ] = []
         for node in self.nodes:
-            if node.pull_from_upstream_agg_key not in keys:
+            if node.pull_from_downstream_agg_key not in agg_method_keys:
+                nodes_with_missing_downstream_keys.append(node)
+            if node.pull_from_upstream_agg_key not in agg_method_keys:
                 nodes_with_missing_upstream_keys.append(node)
 
+        errors: list[str] = []
+        if edges_with_missing_upstream_keys or edges_with_missing_downstream_keys:
+            errors.append(
+                "The following edges have missing upstream keys: "
+                f"{[(edge.id, edge.name, edge.upstream_method_key) for edge in edges_with_missing_upstream_keys]}.\n"
+                "The following edges have missing downstream keys: "
+                f"{[(edge.id, edge.name, edge.downstream_method_key) for edge in edges_with_missing_downstream_keys]}.\n"
+            )
+
         if nodes_with_missing_downstream_keys or nodes_with_missing_upstream_keys:
-            raise ValueError(
+            errors.append(
                 "The following nodes have missing downstream aggregation keys: "
                 f"{[(node.id, node.name, node.pull_from_downstream_agg_key) for node in nodes_with_missing_downstream_keys]}.\n"
                 "The following nodes have missing upstream aggregation keys: "
                 f"{[(node.id, node.name, node.pull_from_upstream_agg_key) for node in nodes_with_missing_upstream_keys]}.\n"
             )
 
-        return self
-
-    @model_validator(mode="after")
-    def _validate_edge_node_ids(self) -> Self:
-        """Validate that all edge node IDs reference existing nodes in the graph."""
-        node_ids = {node.id for node in self.nodes}
-        edges_with_invalid_upstream_node_ids: list[Edge] = []
-        for edge in self.edges:
-            if edge.upstream_node_id not in node_ids:
-                edges_with_invalid_upstream_node_ids.append(edge)
-
-        edges_with_invalid_downstream_node_ids: list[Edge] = []
-        for edge in self.edges:
-            if edge.downstream_node_id not in node_ids:
-                edges_with_invalid_downstream_node_ids.append(edge)
-
         if (
             edges_with_invalid_upstream_node_ids
             or edges_with_invalid_downstream_node_ids
         ):
-            raise ValueError(
+            errors.append(
                 "The following edges have invalid upstream node IDs: "
                 f"{[(edge.id, edge.name, edge.upstream_node_id) for edge in edges_with_invalid_upstream_node_ids]}.\n"
                 "The following edges have invalid downstream node IDs: "
                 f"{[(edge.id, edge.name, edge.downstream_node_id) for edge in edges_with_invalid_downstream_node_ids]}.\n"
             )
 
-        return self
+        if not errors:
+            # cycle detection relies on every edge referencing an existing node
+            try:
+                _ = self.topo_order
+            except ValueError as e:
+                errors.append(str(e))
 
-    @model_validator(mode="after")
-    def _warn_orphaned_nodes(self) -> Self:
-        """Warn about orphaned nodes (nodes with no edges connected to them)."""
-        # Find all node IDs that appear in edges (either as upstream or downstream)
-        nodes_with_edges = set()
-        for edge in self.edges:
-            nodes_with_edges.add(edge.upstream_node_id)
-            nodes_with_edges.add(edge.downstream_node_id)
+        if errors:
+            raise ValueError("".join(errors))
 
-        # Find orphaned nodes (nodes with no edges)
-        orphaned_nodes: list[Node[BaseVariablesT, PulledVariablesT, MetadataT]] = []
-        for node in self.nodes:
-            if node.id not in nodes_with_edges:
-                orphaned_nodes.append(node)
-
-        if orphaned_nodes:
+        if self.orphaned_nodes:
             warnings.warn(
                 "The following nodes have no edges (orphaned nodes): "
-                f"{[(node.id, node.name) for node in orphaned_nodes]}",
+                f"{[(node.id, node.name) for node in self.orphaned_nodes]}",
                 UserWarning,
                 stacklevel=2,
             )
 
         return self
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Return a copy of the graph without any of the cached derived views.
+
+        The cached properties are stored in the instance __dict__ alongside the
+        fields, so they would otherwise be carried over and go stale under update=.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for cls in type(self).__mro__:
+            for name, attr in vars(cls).items():
+                if isinstance(attr, cached_property):
+                    copied.__dict__.pop(name, None)
+        return copied
+
     @cached_property
     def node_ids(self) -> list[int]:
         """Return a sorted list of all node IDs in the graph."""
@@ -387,17 +569,116 @@ class Graph(
     @cached_property
     def root_nodes(self) -> list[Node[BaseVariablesT, PulledVariablesT, MetadataT]]:
         """Return nodes with no incoming edges (never appear as downstream_node_id)."""
-        # find nodes with no edges pointing upstream (eg, they are never present in downstream_node_id)
-        # these are the root nodes
-        non_root_node_ids = {_.downstream_node_id for _ in self.edges}
-        root_node_ids = set(self.node_ids) - non_root_node_ids
-        return [_ for _ in self.nodes if _.id in root_node_ids]
+        # the adjacency maps are already built by cycle detection during validation
+        return [_ for _ in self.nodes if not self.incoming_edges[_.id]]
 
     @cached_property
     def leaf_nodes(self) -> list[Node[BaseVariablesT, PulledVariablesT, MetadataT]]:
         """Return nodes with no outgoing edges (never appear as upstream_node_id)."""
-        # find nodes with no edges pointing downstream (eg, they are never present in upstream_node_id)
-        # these are the leaf nodes
-        non_leaf_node_ids = {_.upstream_node_id for _ in self.edges}
-        leaf_node_ids = set(self.node_ids) - non_leaf_node_ids
-        return [_ for _ in self.nodes if _.id in leaf_node_ids]
+        # the adjacency maps are already built by cycle detection during validation
+        return [_ for _ in self.nodes if not self.outgoing_edges[_.id]]
+
+    @cached_property
+    def orphaned_nodes(
+        self,
+    ) -> list[Node[BaseVariablesT, PulledVariablesT, MetadataT]]:
+        """Return nodes with no edges connected to them."""
+        return [
+            _
+            for _ in self.nodes
+            if not self.incoming_edges[_.id] and not self.outgoing_edges[_.id]
+        ]
+
+    @cached_property
+    def incoming_edges(self) -> dict[int, list[Edge]]:
+        """Return a dictionary mapping node IDs to the edges pointing into them."""
+        incoming: dict[int, list[Edge]] = {_.id: [] for _ in self.nodes}
+        for edge in self.edges:
+            incoming[edge.downstream_node_id].append(edge)
+        return incoming
+
+    @cached_property
+    def outgoing_edges(self) -> dict[int, list[Edge]]:
+        """Return a dictionary mapping node IDs to the edges pointing out of them."""
+        outgoing: dict[int, list[Edge]] = {_.id: [] for _ in self.nodes}
+        for edge in self.edges:
+            outgoing[edge.upstream_node_id].append(edge)
+        return outgoing
+
+    @cached_property
+    def upstream_adj(self) -> dict[int, list[int]]:
+        """Return a dictionary mapping node IDs to the IDs of their direct upstream nodes."""
+        return {
+            node_id: [_.upstream_node_id for _ in edges]
+            for node_id, edges in self.incoming_edges.items()
+        }
+
+    @cached_property
+    def downstream_adj(self) -> dict[int, list[int]]:
+        """Return a dictionary mapping node IDs to the IDs of their direct downstream nodes."""
+        return {
+            node_id: [_.downstream_node_id for _ in edges]
+            for node_id, edges in self.outgoing_edges.items()
+        }
+
+    @cached_property
+    def topo_order(self) -> list[int]:
+        """Return node IDs in topological order (upstream nodes before downstream nodes).
+
+        Uses Kahn's algorithm, repeatedly emitting nodes with no remaining upstream nodes.
+
+        Raises:
+            ValueError: If the edges form a cycle.
+        """
+        in_degree = {node_id: len(v) for node_id, v in self.upstream_adj.items()}
+        queue = deque(node_id for node_id, v in in_degree.items() if v == 0)
+        order: list[int] = []
+        while queue:
+            node_id = queue.popleft()
+            order.append(node_id)
+            for downstream_node_id in self.downstream_adj[node_id]:
+                in_degree[downstream_node_id] -= 1
+                if in_degree[downstream_node_id] == 0:
+                    queue.append(downstream_node_id)
+
+        if len(order) != len(self.nodes):
+            # nodes that never reached zero in-degree are in, between or downstream of
+            # cycles, so keep only those in a strongly connected component among them
+            on_cycle = _nodes_on_cycles(
+                (node_id for node_id, v in in_degree.items() if v > 0),
+                self.downstream_adj,
+            )
+            raise ValueError(
+                "The following nodes are part of a cycle: "
+                f"{[(node.id, node.name) for node in self.nodes if node.id in on_cycle]}"
+            )
+
+        return order
+
+    @cached_property
+    def _upstream_node_id_sets(self) -> dict[int, set[int]]:
+        """Return a dictionary mapping node IDs to the set of IDs of all their upstream nodes."""
+        return _reachable_node_id_sets(self.upstream_adj, self.topo_order)
+
+    @cached_property
+    def _downstream_node_id_sets(self) -> dict[int, set[int]]:
+        """Return a dictionary mapping node IDs to the set of IDs of all their downstream nodes."""
+        return _reachable_node_id_sets(self.downstream_adj, reversed(self.topo_order))
+
+    @cached_property
+    def upstream_node_ids(self) -> dict[int, list[int]]:
+        """Return a dictionary mapping node IDs to the sorted IDs of all their upstream nodes."""
+        return {_.id: sorted(self._upstream_node_id_sets[_.id]) for _ in self.nodes}
+
+    @cached_property
+    def downstream_node_ids(self) -> dict[int, list[int]]:
+        """Return a dictionary mapping node IDs to the sorted IDs of all their downstream nodes."""
+        return {_.id: sorted(self._downstream_node_id_sets[_.id]) for _ in self.nodes}
+
+    def is_upstream_of(self, node_id: int, other_node_id: int) -> bool:
+        """Return whether node_id is (transitively) upstream of other_node_id."""
+        return node_id in self._upstream_node_id_sets[other_node_id]
+
+    def is_downstream_of(self, node_id: int, other_node_id: int) -> bool:
+        """Return whether node_id is (transitively) downstream of other_node_id."""
+        return node_id in self._downstream_node_id_sets[other_node_id]
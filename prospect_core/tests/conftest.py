@@ -6,6 +6,7 @@ from prospect_core.core.graph import Edge, Graph, Node
 
 
 class HasAsDict(Protocol):
+    @property
     def as_dict(self) -> dict[str, Callable]: ...  # type: ignore[type-arg]
 
 
@@ -22,6 +23,6 @@ def graph(
         nodes=nodes,
         edges=edges,
         global_variables=global_variables,
-        pull_methods=spy_pull_methods.as_dict(),
-        agg_methods=spy_agg_methods.as_dict(),
+        pull_methods=spy_pull_methods.as_dict,
+        agg_methods=spy_agg_methods.as_dict,
     )
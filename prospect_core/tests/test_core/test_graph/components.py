@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, TypedDict
 
 from pydantic import BaseModel, PrivateAttr
@@ -45,6 +46,7 @@ class SpyAggMethods(BaseModel):
         )
         return node
 
+    @cached_property
     def as_dict(
         self,
     ) -> dict[str, AggregationMethod[BaseVariables, PulledVariables, Metadata]]:
@@ -62,7 +64,7 @@ class SpyPullMethods(BaseModel):
         graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
     ) -> PulledVariables:
 
-        if direction == Direction.from_upstream:
+        if direction is Direction.from_upstream:
             node_id = edge.upstream_node_id
         else:
             node_id = edge.downstream_node_id
@@ -70,6 +72,7 @@ class SpyPullMethods(BaseModel):
         pulled_variables = graph.nodes_as_dict[node_id].pulled_variables
         return pulled_variables
 
+    @cached_property
     def as_dict(
         self,
     ) -> dict[
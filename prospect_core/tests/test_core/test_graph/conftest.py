@@ -18,6 +18,8 @@ def spy_pull_methods() -> SpyPullMethods:
 
 @pytest.fixture
 def node00() -> SpyNode:
+    # validated, unlike the other node fixtures, so every graph test also runs field
+    # validation (MethodKey interning, extra="forbid") on a fixture-built node
     return SpyNode(
         id=0,
         name="node00",
@@ -37,7 +39,7 @@ def node00() -> SpyNode:
 
 @pytest.fixture
 def node01() -> SpyNode:
-    return SpyNode(
+    return SpyNode.model_construct(
         id=1,
         name="node01",
         base_variables={
@@ -56,7 +58,7 @@ def node01() -> SpyNode:
 
 @pytest.fixture
 def node02() -> SpyNode:
-    return SpyNode(
+    return SpyNode.model_construct(
         id=2,
         name="node02",
         base_variables={
@@ -73,9 +75,87 @@ def node02() -> SpyNode:
     )
 
 
+@pytest.fixture
+def node03() -> SpyNode:
+    return SpyNode.model_construct(
+        id=3,
+        name="node03",
+        base_variables={
+            "base_var0": 40,
+            "base_var1": 400,
+        },
+        pulled_variables={
+            "pulled_var0": None,
+            "pulled_var1": None,
+        },
+        metadata={"metadata_var0": "node03"},
+        pull_from_downstream_agg_key="pass_through",
+        pull_from_upstream_agg_key="pass_through",
+    )
+
+
+@pytest.fixture
+def node04() -> SpyNode:
+    return SpyNode.model_construct(
+        id=4,
+        name="node04",
+        base_variables={
+            "base_var0": 50,
+            "base_var1": 500,
+        },
+        pulled_variables={
+            "pulled_var0": None,
+            "pulled_var1": None,
+        },
+        metadata={"metadata_var0": "node04"},
+        pull_from_downstream_agg_key="pass_through",
+        pull_from_upstream_agg_key="pass_through",
+    )
+
+
+@pytest.fixture
+def node05() -> SpyNode:
+    return SpyNode.model_construct(
+        id=5,
+        name="node05",
+        base_variables={
+            "base_var0": 60,
+            "base_var1": 600,
+        },
+        pulled_variables={
+            "pulled_var0": None,
+            "pulled_var1": None,
+        },
+        metadata={"metadata_var0": "node05"},
+        pull_from_downstream_agg_key="pass_through",
+        pull_from_upstream_agg_key="pass_through",
+    )
+
+
+@pytest.fixture
+def node06() -> SpyNode:
+    return SpyNode.model_construct(
+        id=6,
+        name="node06",
+        base_variables={
+            "base_var0": 70,
+            "base_var1": 700,
+        },
+        pulled_variables={
+            "pulled_var0": None,
+            "pulled_var1": None,
+        },
+        metadata={"metadata_var0": "node06"},
+        pull_from_downstream_agg_key="pass_through",
+        pull_from_upstream_agg_key="pass_through",
+    )
+
+
 @pytest.fixture
 def edge00_01() -> Edge:
     """Edge node00->node01"""
+    # validated, unlike the other edge fixtures, so Edge field validation and the
+    # self-loop check also run on a fixture-built edge
     return Edge(
         id=10,
         name="edge_node00->node01",
@@ -89,6 +169,8 @@ def edge00_01() -> Edge:
 @pytest.fixture
 def edge01_02() -> Edge:
     """Edge node00->node01"""
+    # validated, unlike the other edge fixtures, so Edge field validation and the
+    # self-loop check also run on a fixture-built edge
     return Edge(
         id=20,
         name="edge_node01->node02",
@@ -102,7 +184,7 @@ def edge01_02() -> Edge:
 @pytest.fixture
 def edge00_02() -> Edge:
     """Edge node00->node02"""
-    return Edge(
+    return Edge.model_construct(
         id=30,
         name="edge_node00->node02",
         upstream_node_id=0,
@@ -112,15 +194,101 @@ def edge00_02() -> Edge:
     )
 
 
+@pytest.fixture
+def edge02_00() -> Edge:
+    """Edge node02->node00"""
+    return Edge.model_construct(
+        id=40,
+        name="edge_node02->node00",
+        upstream_node_id=2,
+        downstream_node_id=0,
+        downstream_method_key="get",
+        upstream_method_key="get",
+    )
+
+
+@pytest.fixture
+def edge02_03() -> Edge:
+    """Edge node02->node03"""
+    return Edge.model_construct(
+        id=50,
+        name="edge_node02->node03",
+        upstream_node_id=2,
+        downstream_node_id=3,
+        downstream_method_key="get",
+        upstream_method_key="get",
+    )
+
+
+@pytest.fixture
+def edge03_04() -> Edge:
+    """Edge node03->node04"""
+    return Edge.model_construct(
+        id=60,
+        name="edge_node03->node04",
+        upstream_node_id=3,
+        downstream_node_id=4,
+        downstream_method_key="get",
+        upstream_method_key="get",
+    )
+
+
+@pytest.fixture
+def edge04_05() -> Edge:
+    """Edge node04->node05"""
+    return Edge.model_construct(
+        id=70,
+        name="edge_node04->node05",
+        upstream_node_id=4,
+        downstream_node_id=5,
+        downstream_method_key="get",
+        upstream_method_key="get",
+    )
+
+
+@pytest.fixture
+def edge05_06() -> Edge:
+    """Edge node05->node06"""
+    return Edge.model_construct(
+        id=80,
+        name="edge_node05->node06",
+        upstream_node_id=5,
+        downstream_node_id=6,
+        downstream_method_key="get",
+        upstream_method_key="get",
+    )
+
+
+@pytest.fixture
+def edge06_04() -> Edge:
+    """Edge node06->node04"""
+    return Edge.model_construct(
+        id=90,
+        name="edge_node06->node04",
+        upstream_node_id=6,
+        downstream_node_id=4,
+        downstream_method_key="get",
+        upstream_method_key="get",
+    )
+
+
 @pytest.fixture
 def nodes(
     node00: SpyNode,
     node01: SpyNode,
     node02: SpyNode,
+    node03: SpyNode,
+    node04: SpyNode,
+    node05: SpyNode,
+    node06: SpyNode,
     request: CanSpecListOfStr,
 ) -> list[SpyNode]:
     """Returns a filtered list of nodes."""
-    return [_ for _ in [node00, node01, node02] if _.name in request.param]
+    return [
+        _
+        for _ in [node00, node01, node02, node03, node04, node05, node06]
+        if _.name in request.param
+    ]
 
 
 @pytest.fixture
@@ -128,10 +296,30 @@ def edges(
     edge00_01: Edge,
     edge00_02: Edge,
     edge01_02: Edge,
+    edge02_00: Edge,
+    edge02_03: Edge,
+    edge03_04: Edge,
+    edge04_05: Edge,
+    edge05_06: Edge,
+    edge06_04: Edge,
     request: CanSpecListOfStr,
 ) -> list[Edge]:
     """Returns a filtered list of edges."""
-    return [_ for _ in [edge00_01, edge00_02, edge01_02] if _.name in request.param]
+    return [
+        _
+        for _ in [
+            edge00_01,
+            edge00_02,
+            edge01_02,
+            edge02_00,
+            edge02_03,
+            edge03_04,
+            edge04_05,
+            edge05_06,
+            edge06_04,
+        ]
+        if _.name in request.param
+    ]
 
 
 @pytest.fixture
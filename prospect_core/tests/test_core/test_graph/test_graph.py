@@ -1,4 +1,5 @@
-from copy import deepcopy
+import sys
+from typing import Any
 
 import pytest
 
@@ -15,24 +16,89 @@ from .components import (
     SpyPullMethods,
 )
 
+# match= patterns shared by several tests or cases, escaped once at import
+_EDGE_SELF_LOOP_MATCH = escape_braces(
+    r"1 validation error for Edge\n  Value error, edge: (5, 'foo') has a cyclical dependency."
+)
+_CYCLE_MATCH_PREFIX = escape_braces(
+    r"1 validation error for Graph\n  Value error, The following nodes are part of a cycle: "
+)
 
-def test_Edge_raises_ValueError_if_dup_node_ids() -> None:
+
+@pytest.mark.parametrize(
+    "downstream_node_id, upstream_node_id",
+    [
+        pytest.param(0, 0, id="ints"),
+        pytest.param("0", 0, id="coercible_str"),
+        pytest.param("1", "01", id="coercible_strs"),
+    ],
+)
+def test_Edge_raises_ValueError_if_dup_node_ids(
+    downstream_node_id: Any, upstream_node_id: Any
+) -> None:
     with pytest.raises(
         ValueError,
-        match=escape_braces(
-            r"1 validation error for Edge\n  Value error, edge: (5, 'foo') has a cyclical dependency."
-        ),
+        match=_EDGE_SELF_LOOP_MATCH,
+    ):
+        _ = Edge(
+            id=5,
+            name="foo",
+            downstream_node_id=downstream_node_id,
+            upstream_node_id=upstream_node_id,
+            downstream_method_key="foo",
+            upstream_method_key="foo",
+        )
+
+
+def test_Edge_raises_ValueError_if_dup_node_ids_from_json() -> None:
+    with pytest.raises(
+        ValueError,
+        match=_EDGE_SELF_LOOP_MATCH,
+    ):
+        _ = Edge.model_validate_json(
+            '{"id": 5, "name": "foo", "downstream_node_id": "0", "upstream_node_id": 0,'
+            ' "downstream_method_key": "foo", "upstream_method_key": "foo"}'
+        )
+
+
+def test_Edge_raises_ValueError_if_extra_field() -> None:
+    with pytest.raises(
+        ValueError,
+        match=r"1 validation error for Edge\nupstream_method\n  Extra inputs are not permitted",
     ):
         _ = Edge(
             id=5,
             name="foo",
             downstream_node_id=0,
-            upstream_node_id=0,
+            upstream_node_id=1,
             downstream_method_key="foo",
             upstream_method_key="foo",
+            upstream_method="foo",  # type: ignore[call-arg]
         )
 
 
+def test_Edge_interns_method_keys() -> None:
+    """Test that Edge method keys built at runtime are interned."""
+    edge = Edge(
+        id=5,
+        name="foo",
+        downstream_node_id=0,
+        upstream_node_id=1,
+        downstream_method_key="".join(list("get")),
+        upstream_method_key="".join(list("get")),
+    )
+    assert edge.downstream_method_key is sys.intern("get")
+    assert edge.upstream_method_key is sys.intern("get")
+
+
+def test_Edge_is_frozen(edge00_01: Edge) -> None:
+    """Test that Edge cannot be mutated and is hashable."""
+    with pytest.raises(ValueError, match="Instance is frozen"):
+        edge00_01.upstream_node_id = 2
+
+    assert hash(edge00_01) == hash(edge00_01.model_copy())
+
+
 @pytest.mark.parametrize(
     "nodes, edges, global_variables",
     [
@@ -52,6 +118,28 @@ def test_can_make_graph(
     assert isinstance(graph, Graph)
 
 
+@pytest.mark.parametrize(
+    "nodes, edges",
+    [
+        pytest.param(
+            ["node00", "node01"],
+            ["edge_node00->node01"],
+            id="basic_graph",
+        )
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_is_frozen(
+    graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
+) -> None:
+    """Test that nodes and edges are stored as tuples and Graph cannot be mutated."""
+    assert isinstance(graph.nodes, tuple)
+    assert isinstance(graph.edges, tuple)
+
+    with pytest.raises(ValueError, match="Instance is frozen"):
+        graph.nodes = ()
+
+
 @pytest.mark.parametrize(
     "nodes, edges",
     [
@@ -64,21 +152,21 @@ def test_can_make_graph(
     indirect=["nodes", "edges"],
 )
 @pytest.mark.parametrize(
-    "name_or_id, expected_match",
+    "update, expected_message",
     [
         pytest.param(
-            "id",
-            r"1 validation error for Graph\nnodes\n  Value error, Duplicated ids: {0: [(0, 'node00'), (0, 'node1000')]}",
+            {"name": "node1000"},
+            "1 validation error for Graph\nnodes\n  Value error, Duplicated ids: {0: [(0, 'node00'), (0, 'node1000')]}",
             id="id",
         ),
         pytest.param(
-            "name",
-            r"1 validation error for Graph\nnodes\n  Value error, Duplicated names: {'node00': [(0, 'node00'), (1000, 'node00')]} ",
+            {"id": 1000},
+            "1 validation error for Graph\nnodes\n  Value error, Duplicated names: {'node00': [(0, 'node00'), (1000, 'node00')]} ",
             id="name",
         ),
         pytest.param(
-            "both",
-            r"1 validation error for Graph\nnodes\n  Value error, Duplicated ids: {0: [(0, 'node00'), (0, 'node00')]}.\nDuplicated names: {'node00': [(0, 'node00'), (0, 'node00')]}",
+            {},
+            "1 validation error for Graph\nnodes\n  Value error, Duplicated ids: {0: [(0, 'node00'), (0, 'node00')]}.\nDuplicated names: {'node00': [(0, 'node00'), (0, 'node00')]}",
             id="both",
         ),
     ],
@@ -89,27 +177,24 @@ def test_Graph_raises_ValueError_if_nodes_id_name_not_unique(
     global_variables: GlobalVariables,
     spy_agg_methods: SpyAggMethods,
     spy_pull_methods: SpyPullMethods,
-    name_or_id: str,
-    expected_match: str,
+    update: dict[str, Any],
+    expected_message: str,
 ) -> None:
     """Test unique node id and name checking behaviour for nodes."""
 
     # add a node with a duplicated id, name or both
-    duped_node = deepcopy(nodes[0])
-    if name_or_id == "name":
-        duped_node.id = 1000
-    elif name_or_id == "id":
-        duped_node.name = "node1000"
+    duped_node = nodes[0].model_copy(update=update)
     nodes.append(duped_node)
 
-    with pytest.raises(ValueError, match=escape_braces(expected_match)):
+    with pytest.raises(ValueError) as exc_info:
         _ = Graph(
             nodes=nodes,
             edges=edges,
             global_variables=global_variables,
-            pull_methods=spy_pull_methods.as_dict(),
-            agg_methods=spy_agg_methods.as_dict(),
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
         )
+    assert expected_message in str(exc_info.value)
 
 
 @pytest.mark.parametrize(
@@ -124,21 +209,21 @@ def test_Graph_raises_ValueError_if_nodes_id_name_not_unique(
     indirect=["nodes", "edges"],
 )
 @pytest.mark.parametrize(
-    "name_or_id, expected_match",
+    "update, expected_message",
     [
         pytest.param(
-            "id",
-            r"1 validation error for Graph\nedges\n  Value error, Duplicated ids: {10: [(10, 'edge_node00->node01'), (10, 'edge_node00->node02')]}",
+            {"name": "edge_node00->node02"},
+            "1 validation error for Graph\nedges\n  Value error, Duplicated ids: {10: [(10, 'edge_node00->node01'), (10, 'edge_node00->node02')]}",
             id="id",
         ),
         pytest.param(
-            "name",
-            r"1 validation error for Graph\nedges\n  Value error, Duplicated names: {'edge_node00->node01': [(10, 'edge_node00->node01'), (1000, 'edge_node00->node01')]}",
+            {"id": 1000},
+            "1 validation error for Graph\nedges\n  Value error, Duplicated names: {'edge_node00->node01': [(10, 'edge_node00->node01'), (1000, 'edge_node00->node01')]}",
             id="name",
         ),
         pytest.param(
-            "both",
-            r"1 validation error for Graph\nedges\n  Value error, Duplicated ids: {10: [(10, 'edge_node00->node01'), (10, 'edge_node00->node01')]}.\nDuplicated names: {'edge_node00->node01': [(10, 'edge_node00->node01'), (10, 'edge_node00->node01')]}.",
+            {},
+            "1 validation error for Graph\nedges\n  Value error, Duplicated ids: {10: [(10, 'edge_node00->node01'), (10, 'edge_node00->node01')]}.\nDuplicated names: {'edge_node00->node01': [(10, 'edge_node00->node01'), (10, 'edge_node00->node01')]}.",
             id="both",
         ),
     ],
@@ -149,27 +234,24 @@ def test_Graph_raises_ValueError_if_edge_id_name_not_unique(
     global_variables: GlobalVariables,
     spy_agg_methods: SpyAggMethods,
     spy_pull_methods: SpyPullMethods,
-    name_or_id: str,
-    expected_match: str,
+    update: dict[str, Any],
+    expected_message: str,
 ) -> None:
     """Test unique node id and name checking behaviour for edges."""
 
     # add a edge with a duplicated id, name or both
-    duped_edge = deepcopy(edges[0])
-    if name_or_id == "name":
-        duped_edge.id = 1000
-    elif name_or_id == "id":
-        duped_edge.name = "edge_node00->node02"
+    duped_edge = edges[0].model_copy(update=update)
     edges.append(duped_edge)
 
-    with pytest.raises(ValueError, match=escape_braces(expected_match)):
+    with pytest.raises(ValueError) as exc_info:
         _ = Graph(
             nodes=nodes,
             edges=edges,
             global_variables=global_variables,
-            pull_methods=spy_pull_methods.as_dict(),
-            agg_methods=spy_agg_methods.as_dict(),
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
         )
+    assert expected_message in str(exc_info.value)
 
 
 @pytest.mark.parametrize(
@@ -184,21 +266,36 @@ def test_Graph_raises_ValueError_if_edge_id_name_not_unique(
     indirect=["nodes", "edges"],
 )
 @pytest.mark.parametrize(
-    "direction, expected_match",
+    "updates, expected_message",
     [
         pytest.param(
-            "same_direction",
-            r"1 validation error for Graph\nedges\n  Value error, Duplicate edges in same direction: [(20, 'edge_node00->node01_dup')].",
+            [{"id": 20, "name": "edge_node00->node01_dup"}],
+            "1 validation error for Graph\nedges\n  Value error, Duplicate edges in same direction: [(20, 'edge_node00->node01_dup')].",
             id="same_direction",
         ),
         pytest.param(
-            "opposite_direction",
-            r"1 validation error for Graph\nedges\n  Value error, Bidirectional edges found (violates acyclic property): [(20, 'edge_node01->node00')].",
+            [
+                {
+                    "id": 20,
+                    "name": "edge_node01->node00",
+                    "upstream_node_id": 1,
+                    "downstream_node_id": 0,
+                }
+            ],
+            "1 validation error for Graph\nedges\n  Value error, Bidirectional edges found (violates acyclic property): [(20, 'edge_node01->node00')].",
             id="opposite_direction",
         ),
         pytest.param(
-            "both",
-            r"1 validation error for Graph\nedges\n  Value error, Duplicate edges in same direction: [(20, 'edge_node00->node01_dup')].\nBidirectional edges found (violates acyclic property): [(30, 'edge_node01->node00')].",
+            [
+                {"id": 20, "name": "edge_node00->node01_dup"},
+                {
+                    "id": 30,
+                    "name": "edge_node01->node00",
+                    "upstream_node_id": 1,
+                    "downstream_node_id": 0,
+                },
+            ],
+            "1 validation error for Graph\nedges\n  Value error, Duplicate edges in same direction: [(20, 'edge_node00->node01_dup')].\nBidirectional edges found (violates acyclic property): [(30, 'edge_node01->node00')].",
             id="both",
         ),
     ],
@@ -209,63 +306,25 @@ def test_Graph_raises_ValueError_if_edge_duplicated(
     global_variables: GlobalVariables,
     spy_agg_methods: SpyAggMethods,
     spy_pull_methods: SpyPullMethods,
-    direction: str,
-    expected_match: str,
+    updates: list[dict[str, Any]],
+    expected_message: str,
 ) -> None:
     """Test unique edge checking behaviour."""
 
-    # Add duplicate edge(s) based on direction parameter
-    if direction == "same_direction":
-        # Add another edge in the same direction (node00->node01)
-        duped_edge = Edge(
-            id=20,
-            name="edge_node00->node01_dup",
-            upstream_node_id=0,
-            downstream_node_id=1,
-            downstream_method_key="get",
-            upstream_method_key="get",
-        )
-        edges.append(duped_edge)
-    elif direction == "opposite_direction":
-        # Add an edge in the opposite direction (node01->node00)
-        opposite_edge = Edge(
-            id=20,
-            name="edge_node01->node00",
-            upstream_node_id=1,
-            downstream_node_id=0,
-            downstream_method_key="get",
-            upstream_method_key="get",
-        )
-        edges.append(opposite_edge)
-    elif direction == "both":
-        # Add both: a same direction duplicate and an opposite direction edge
-        duped_edge = Edge(
-            id=20,
-            name="edge_node00->node01_dup",
-            upstream_node_id=0,
-            downstream_node_id=1,
-            downstream_method_key="get",
-            upstream_method_key="get",
-        )
-        opposite_edge = Edge(
-            id=30,
-            name="edge_node01->node00",
-            upstream_node_id=1,
-            downstream_node_id=0,
-            downstream_method_key="get",
-            upstream_method_key="get",
-        )
-        edges.append(duped_edge)
-        edges.append(opposite_edge)
+    # Add edge(s) copied from node00->node01, either as a same direction duplicate
+    # or flipped to run node01->node00
+    base_edge = edges[0]
+    edges.extend(base_edge.model_copy(update=update) for update in updates)
 
-    with pytest.raises(ValueError, match=escape_braces(expected_match)):
+    with pytest.raises(ValueError) as exc_info:
         _ = Graph(
             nodes=nodes,
             edges=edges,
             global_variables=global_variables,
-            pull_methods=spy_pull_methods.as_dict(),
-            agg_methods=spy_agg_methods.as_dict(),
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
         )
+    assert expected_message in str(exc_info.value)
 
 
 @pytest.mark.parametrize(
@@ -280,21 +339,24 @@ def test_Graph_raises_ValueError_if_edge_duplicated(
     indirect=["nodes", "edges"],
 )
 @pytest.mark.parametrize(
-    "direction, expected_match",
+    "update, expected_message",
     [
         pytest.param(
-            "upstream",
-            r"1 validation error for Graph\n  Value error, The following edges have missing upstream keys: [(10, 'edge_node00->node01', 'missing_upstream_method')].\nThe following edges have missing downstream keys: [].",
+            {"upstream_method_key": "missing_upstream_method"},
+            "1 validation error for Graph\n  Value error, The following edges have missing upstream keys: [(10, 'edge_node00->node01', 'missing_upstream_method')].\nThe following edges have missing downstream keys: [].",
             id="upstream",
         ),
         pytest.param(
-            "downstream",
-            r"1 validation error for Graph\n  Value error, The following edges have missing upstream keys: [].\nThe following edges have missing downstream keys: [(10, 'edge_node00->node01', 'missing_downstream_method')].",
+            {"downstream_method_key": "missing_downstream_method"},
+            "1 validation error for Graph\n  Value error, The following edges have missing upstream keys: [].\nThe following edges have missing downstream keys: [(10, 'edge_node00->node01', 'missing_downstream_method')].",
             id="downstream",
         ),
         pytest.param(
-            "both",
-            r"1 validation error for Graph\n  Value error, The following edges have missing upstream keys: [(10, 'edge_node00->node01', 'missing_upstream_method')].\nThe following edges have missing downstream keys: [(10, 'edge_node00->node01', 'missing_downstream_method')].",
+            {
+                "upstream_method_key": "missing_upstream_method",
+                "downstream_method_key": "missing_downstream_method",
+            },
+            "1 validation error for Graph\n  Value error, The following edges have missing upstream keys: [(10, 'edge_node00->node01', 'missing_upstream_method')].\nThe following edges have missing downstream keys: [(10, 'edge_node00->node01', 'missing_downstream_method')].",
             id="both",
         ),
     ],
@@ -305,28 +367,23 @@ def test_Graph_raises_ValueError_if_missing_pull_method_key(
     global_variables: GlobalVariables,
     spy_agg_methods: SpyAggMethods,
     spy_pull_methods: SpyPullMethods,
-    direction: str,
-    expected_match: str,
+    update: dict[str, Any],
+    expected_message: str,
 ) -> None:
     """Test that Graph validates pull method keys exist in pull_methods dict."""
 
     # Modify edge to reference missing pull method key(s)
-    if direction == "upstream":
-        edges[0].upstream_method_key = "missing_upstream_method"
-    elif direction == "downstream":
-        edges[0].downstream_method_key = "missing_downstream_method"
-    elif direction == "both":
-        edges[0].upstream_method_key = "missing_upstream_method"
-        edges[0].downstream_method_key = "missing_downstream_method"
-
-    with pytest.raises(ValueError, match=escape_braces(expected_match)):
+    edges[0] = edges[0].model_copy(update=update)
+
+    with pytest.raises(ValueError) as exc_info:
         _ = Graph(
             nodes=nodes,
             edges=edges,
             global_variables=global_variables,
-            pull_methods=spy_pull_methods.as_dict(),
-            agg_methods=spy_agg_methods.as_dict(),
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
         )
+    assert expected_message in str(exc_info.value)
 
 
 @pytest.mark.parametrize(
@@ -341,21 +398,24 @@ def test_Graph_raises_ValueError_if_missing_pull_method_key(
     indirect=["nodes", "edges"],
 )
 @pytest.mark.parametrize(
-    "direction, expected_match",
+    "update, expected_message",
     [
         pytest.param(
-            "downstream",
-            r"1 validation error for Graph\n  Value error, The following nodes have missing downstream aggregation keys: [(0, 'node00', 'missing_downstream_agg')].\nThe following nodes have missing upstream aggregation keys: [].",
+            {"pull_from_downstream_agg_key": "missing_downstream_agg"},
+            "1 validation error for Graph\n  Value error, The following nodes have missing downstream aggregation keys: [(0, 'node00', 'missing_downstream_agg')].\nThe following nodes have missing upstream aggregation keys: [].",
             id="downstream",
         ),
         pytest.param(
-            "upstream",
-            r"1 validation error for Graph\n  Value error, The following nodes have missing downstream aggregation keys: [].\nThe following nodes have missing upstream aggregation keys: [(0, 'node00', 'missing_upstream_agg')].",
+            {"pull_from_upstream_agg_key": "missing_upstream_agg"},
+            "1 validation error for Graph\n  Value error, The following nodes have missing downstream aggregation keys: [].\nThe following nodes have missing upstream aggregation keys: [(0, 'node00', 'missing_upstream_agg')].",
             id="upstream",
         ),
         pytest.param(
-            "both",
-            r"1 validation error for Graph\n  Value error, The following nodes have missing downstream aggregation keys: [(0, 'node00', 'missing_downstream_agg')].\nThe following nodes have missing upstream aggregation keys: [(0, 'node00', 'missing_upstream_agg')].",
+            {
+                "pull_from_downstream_agg_key": "missing_downstream_agg",
+                "pull_from_upstream_agg_key": "missing_upstream_agg",
+            },
+            "1 validation error for Graph\n  Value error, The following nodes have missing downstream aggregation keys: [(0, 'node00', 'missing_downstream_agg')].\nThe following nodes have missing upstream aggregation keys: [(0, 'node00', 'missing_upstream_agg')].",
             id="both",
         ),
     ],
@@ -366,28 +426,23 @@ def test_Graph_raises_ValueError_if_missing_agg_method_key(
     global_variables: GlobalVariables,
     spy_agg_methods: SpyAggMethods,
     spy_pull_methods: SpyPullMethods,
-    direction: str,
-    expected_match: str,
+    update: dict[str, Any],
+    expected_message: str,
 ) -> None:
     """Test that Graph validates aggregation method keys exist in agg_methods dict."""
 
     # Modify node to reference missing aggregation method key(s)
-    if direction == "downstream":
-        nodes[0].pull_from_downstream_agg_key = "missing_downstream_agg"
-    elif direction == "upstream":
-        nodes[0].pull_from_upstream_agg_key = "missing_upstream_agg"
-    elif direction == "both":
-        nodes[0].pull_from_downstream_agg_key = "missing_downstream_agg"
-        nodes[0].pull_from_upstream_agg_key = "missing_upstream_agg"
-
-    with pytest.raises(ValueError, match=escape_braces(expected_match)):
+    nodes[0] = nodes[0].model_copy(update=update)
+
+    with pytest.raises(ValueError) as exc_info:
         _ = Graph(
             nodes=nodes,
             edges=edges,
             global_variables=global_variables,
-            pull_methods=spy_pull_methods.as_dict(),
-            agg_methods=spy_agg_methods.as_dict(),
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
         )
+    assert expected_message in str(exc_info.value)
 
 
 @pytest.mark.parametrize(
@@ -402,21 +457,21 @@ def test_Graph_raises_ValueError_if_missing_agg_method_key(
     indirect=["nodes", "edges"],
 )
 @pytest.mark.parametrize(
-    "direction, expected_match",
+    "update, expected_message",
     [
         pytest.param(
-            "upstream",
-            r"1 validation error for Graph\n  Value error, The following edges have invalid upstream node IDs: [(10, 'edge_node00->node01', 999)].\nThe following edges have invalid downstream node IDs: [].",
+            {"upstream_node_id": 999},
+            "1 validation error for Graph\n  Value error, The following edges have invalid upstream node IDs: [(10, 'edge_node00->node01', 999)].\nThe following edges have invalid downstream node IDs: [].",
             id="upstream",
         ),
         pytest.param(
-            "downstream",
-            r"1 validation error for Graph\n  Value error, The following edges have invalid upstream node IDs: [].\nThe following edges have invalid downstream node IDs: [(10, 'edge_node00->node01', 999)].",
+            {"downstream_node_id": 999},
+            "1 validation error for Graph\n  Value error, The following edges have invalid upstream node IDs: [].\nThe following edges have invalid downstream node IDs: [(10, 'edge_node00->node01', 999)].",
             id="downstream",
         ),
         pytest.param(
-            "both",
-            r"1 validation error for Graph\n  Value error, The following edges have invalid upstream node IDs: [(10, 'edge_node00->node01', 998)].\nThe following edges have invalid downstream node IDs: [(10, 'edge_node00->node01', 999)].",
+            {"upstream_node_id": 998, "downstream_node_id": 999},
+            "1 validation error for Graph\n  Value error, The following edges have invalid upstream node IDs: [(10, 'edge_node00->node01', 998)].\nThe following edges have invalid downstream node IDs: [(10, 'edge_node00->node01', 999)].",
             id="both",
         ),
     ],
@@ -427,27 +482,140 @@ def test_Graph_raises_ValueError_if_missing_node(
     global_variables: GlobalVariables,
     spy_agg_methods: SpyAggMethods,
     spy_pull_methods: SpyPullMethods,
-    direction: str,
-    expected_match: str,
+    update: dict[str, Any],
+    expected_message: str,
 ) -> None:
     """Test that Graph validates edge node IDs reference existing nodes."""
 
     # Modify edge to reference non-existent node ID(s)
-    if direction == "upstream":
-        edges[0].upstream_node_id = 999
-    elif direction == "downstream":
-        edges[0].downstream_node_id = 999
-    elif direction == "both":
-        edges[0].upstream_node_id = 998
-        edges[0].downstream_node_id = 999
-
-    with pytest.raises(ValueError, match=escape_braces(expected_match)):
+    edges[0] = edges[0].model_copy(update=update)
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = Graph(
+            nodes=nodes,
+            edges=edges,
+            global_variables=global_variables,
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
+        )
+    assert expected_message in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "nodes, edges",
+    [
+        pytest.param(
+            ["node00", "node01"],
+            ["edge_node00->node01"],
+            id="basic_graph",
+        )
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_raises_ValueError_with_all_errors(
+    nodes: list[Node[BaseVariables, PulledVariables, Metadata]],
+    edges: list[Edge],
+    global_variables: GlobalVariables,
+    spy_agg_methods: SpyAggMethods,
+    spy_pull_methods: SpyPullMethods,
+) -> None:
+    """Test that Graph reports every category of validation error at once."""
+
+    edges[0] = edges[0].model_copy(
+        update={
+            "upstream_method_key": "missing_upstream_method",
+            "downstream_node_id": 999,
+        }
+    )
+    nodes[0] = nodes[0].model_copy(
+        update={"pull_from_upstream_agg_key": "missing_upstream_agg"}
+    )
+
+    with pytest.raises(
+        ValueError,
+        match=escape_braces(
+            r"1 validation error for Graph\n  Value error, The following edges have missing upstream keys: [(10, 'edge_node00->node01', 'missing_upstream_method')].\nThe following edges have missing downstream keys: [].\n"
+            r"The following nodes have missing downstream aggregation keys: [].\nThe following nodes have missing upstream aggregation keys: [(0, 'node00', 'missing_upstream_agg')].\n"
+            r"The following edges have invalid upstream node IDs: [].\nThe following edges have invalid downstream node IDs: [(10, 'edge_node00->node01', 999)]."
+        ),
+    ):
+        _ = Graph(
+            nodes=nodes,
+            edges=edges,
+            global_variables=global_variables,
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
+        )
+
+
+@pytest.mark.parametrize(
+    "nodes, edges, cycle_nodes",
+    [
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node01->node02", "edge_node02->node00"],
+            escape_braces("[(0, 'node00'), (1, 'node01'), (2, 'node02')]"),
+            id="three_node_cycle",
+        ),
+        pytest.param(
+            ["node00", "node01", "node02", "node03"],
+            [
+                "edge_node00->node01",
+                "edge_node01->node02",
+                "edge_node02->node00",
+                "edge_node02->node03",
+            ],
+            escape_braces("[(0, 'node00'), (1, 'node01'), (2, 'node02')]"),
+            id="three_node_cycle_with_downstream_node",
+        ),
+        pytest.param(
+            [
+                "node00",
+                "node01",
+                "node02",
+                "node03",
+                "node04",
+                "node05",
+                "node06",
+            ],
+            [
+                "edge_node00->node01",
+                "edge_node01->node02",
+                "edge_node02->node00",
+                "edge_node02->node03",
+                "edge_node03->node04",
+                "edge_node04->node05",
+                "edge_node05->node06",
+                "edge_node06->node04",
+            ],
+            escape_braces(
+                "[(0, 'node00'), (1, 'node01'), (2, 'node02'), (4, 'node04'), (5, 'node05'), (6, 'node06')]"
+            ),
+            id="two_cycles_joined_by_a_node",
+        ),
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_raises_ValueError_if_cyclic(
+    nodes: list[Node[BaseVariables, PulledVariables, Metadata]],
+    edges: list[Edge],
+    global_variables: GlobalVariables,
+    spy_agg_methods: SpyAggMethods,
+    spy_pull_methods: SpyPullMethods,
+    cycle_nodes: str,
+) -> None:
+    """Test that Graph validates the edges do not form a cycle, naming only cycle members."""
+
+    with pytest.raises(
+        ValueError,
+        match=f"{_CYCLE_MATCH_PREFIX}{cycle_nodes} ",
+    ):
         _ = Graph(
             nodes=nodes,
             edges=edges,
             global_variables=global_variables,
-            pull_methods=spy_pull_methods.as_dict(),
-            agg_methods=spy_agg_methods.as_dict(),
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
         )
 
 
@@ -477,14 +645,16 @@ def test_Graph_warns_if_orphan_node(
         UserWarning,
         match=r"The following nodes have no edges \(orphaned nodes\): \[\(0, 'node00'\)\]",
     ):
-        _ = Graph(
+        graph = Graph(
             nodes=nodes,
             edges=edges,
             global_variables=global_variables,
-            pull_methods=spy_pull_methods.as_dict(),
-            agg_methods=spy_agg_methods.as_dict(),
+            pull_methods=spy_pull_methods.as_dict,
+            agg_methods=spy_agg_methods.as_dict,
         )
 
+    assert [_.id for _ in graph.orphaned_nodes] == [0]
+
 
 @pytest.mark.parametrize(
     "nodes, edges, expected_node_ids, expected_edge_ids",
@@ -496,22 +666,33 @@ def test_Graph_warns_if_orphan_node(
             [10, 30],
             id="sample0",
         ),
-        pytest.param(
-            ["node02", "node01", "node00"],
-            ["edge_node00->node02", "edge_node00->node01"],
-            [0, 1, 2],
-            [10, 30],
-            id="sample0_reversed",
-        ),
     ],
     indirect=["nodes", "edges"],
 )
+@pytest.mark.parametrize("reverse", [False, True], ids=["in_order", "reversed"])
 def test_Graph_ids(
-    graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
+    nodes: list[Node[BaseVariables, PulledVariables, Metadata]],
+    edges: list[Edge],
+    global_variables: GlobalVariables,
+    spy_agg_methods: SpyAggMethods,
+    spy_pull_methods: SpyPullMethods,
+    reverse: bool,
     expected_node_ids: list[int],
     expected_edge_ids: list[int],
 ) -> None:
-    """Test output of node_ids and edge_ids."""
+    """Test that node_ids and edge_ids are sorted whatever order the nodes and edges are in."""
+    # the fixtures keep their declaration order, so reverse here to feed unsorted ids
+    if reverse:
+        nodes.reverse()
+        edges.reverse()
+
+    graph = Graph(
+        nodes=nodes,
+        edges=edges,
+        global_variables=global_variables,
+        pull_methods=spy_pull_methods.as_dict,
+        agg_methods=spy_agg_methods.as_dict,
+    )
     assert graph.node_ids == expected_node_ids
     assert graph.edge_ids == expected_edge_ids
 
@@ -586,3 +767,197 @@ def test_Graph_leaf_root_nodes(
 
     leaf_node_ids = [_.id for _ in graph.leaf_nodes]
     assert leaf_node_ids == expected_leaf_node_ids
+
+
+@pytest.mark.parametrize(
+    "nodes, edges",
+    [
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node00->node02"],
+            id="sample0",
+        ),
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_incoming_outgoing_edges(
+    graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
+    edge00_01: Edge,
+    edge00_02: Edge,
+) -> None:
+    """Test behaviour of incoming_edges and outgoing_edges."""
+    assert graph.incoming_edges == {
+        0: [],
+        1: [edge00_01],
+        2: [edge00_02],
+    }
+    assert graph.outgoing_edges == {
+        0: [edge00_01, edge00_02],
+        1: [],
+        2: [],
+    }
+
+
+@pytest.mark.parametrize(
+    "nodes, edges, expected_upstream_adj, expected_downstream_adj",
+    [
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node00->node02"],
+            {0: [], 1: [0], 2: [0]},
+            {0: [1, 2], 1: [], 2: []},
+            id="one_root_two_leaves",
+        ),
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node02", "edge_node01->node02"],
+            {0: [], 1: [], 2: [0, 1]},
+            {0: [2], 1: [2], 2: []},
+            id="two_roots_one_leaf",
+        ),
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node01->node02"],
+            {0: [], 1: [0], 2: [1]},
+            {0: [1], 1: [2], 2: []},
+            id="one_root_one_leaf",
+        ),
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_adj(
+    graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
+    expected_upstream_adj: dict[int, list[int]],
+    expected_downstream_adj: dict[int, list[int]],
+) -> None:
+    """Test behaviour of upstream_adj and downstream_adj."""
+    assert graph.upstream_adj == expected_upstream_adj
+    assert graph.downstream_adj == expected_downstream_adj
+
+
+@pytest.mark.parametrize(
+    "nodes, edges, expected_upstream_node_ids, expected_downstream_node_ids",
+    [
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node00->node02"],
+            {0: [], 1: [0], 2: [0]},
+            {0: [1, 2], 1: [], 2: []},
+            id="one_root_two_leaves",
+        ),
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node02", "edge_node01->node02"],
+            {0: [], 1: [], 2: [0, 1]},
+            {0: [2], 1: [2], 2: []},
+            id="two_roots_one_leaf",
+        ),
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node01->node02"],
+            {0: [], 1: [0], 2: [0, 1]},
+            {0: [1, 2], 1: [2], 2: []},
+            id="one_root_one_leaf",
+        ),
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node00->node02", "edge_node01->node02"],
+            {0: [], 1: [0], 2: [0, 1]},
+            {0: [1, 2], 1: [2], 2: []},
+            id="diamond",
+        ),
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_upstream_downstream_node_ids(
+    graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
+    expected_upstream_node_ids: dict[int, list[int]],
+    expected_downstream_node_ids: dict[int, list[int]],
+) -> None:
+    """Test behaviour of upstream_node_ids and downstream_node_ids."""
+    assert graph.upstream_node_ids == expected_upstream_node_ids
+    assert graph.downstream_node_ids == expected_downstream_node_ids
+
+
+@pytest.mark.parametrize(
+    "nodes, edges",
+    [
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node01->node02"],
+            id="one_root_one_leaf",
+        ),
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_is_upstream_downstream_of(
+    graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
+) -> None:
+    """Test behaviour of is_upstream_of and is_downstream_of."""
+    assert graph.is_upstream_of(0, 2)
+    assert graph.is_downstream_of(2, 0)
+    assert graph.is_upstream_of(1, 2)
+    assert not graph.is_upstream_of(2, 0)
+    assert not graph.is_downstream_of(0, 2)
+    assert not graph.is_upstream_of(0, 0)
+
+
+@pytest.mark.parametrize(
+    "nodes, edges, expected_topo_order",
+    [
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node01", "edge_node01->node02"],
+            [0, 1, 2],
+            id="one_root_one_leaf",
+        ),
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node00->node02", "edge_node01->node02"],
+            [0, 1, 2],
+            id="two_roots_one_leaf",
+        ),
+        pytest.param(
+            ["node00", "node01", "node02"],
+            ["edge_node02->node00", "edge_node00->node01"],
+            [2, 0, 1],
+            id="reversed_ids",
+        ),
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_topo_order(
+    graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
+    expected_topo_order: list[int],
+) -> None:
+    """Test behaviour of topo_order."""
+    assert graph.topo_order == expected_topo_order
+
+
+@pytest.mark.parametrize(
+    "nodes, edges",
+    [
+        pytest.param(
+            ["node00", "node01"],
+            ["edge_node00->node01"],
+            id="basic_graph",
+        )
+    ],
+    indirect=["nodes", "edges"],
+)
+def test_Graph_model_copy_recomputes_cached_views(
+    graph: Graph[BaseVariables, PulledVariables, Metadata, GlobalVariables],
+    edge00_01: Edge,
+) -> None:
+    """Test that a copy with updated edges does not reuse the original's cached views."""
+    assert graph.topo_order == [0, 1]
+
+    reversed_edge = edge00_01.model_copy(
+        update={"upstream_node_id": 1, "downstream_node_id": 0}
+    )
+    copied = graph.model_copy(update={"edges": (reversed_edge,)})
+
+    assert copied.topo_order == [1, 0]
+    assert [_.id for _ in copied.root_nodes] == [1]
+    assert copied.upstream_node_ids == {0: [1], 1: []}
+    assert graph.topo_order == [0, 1]